@@ -1,10 +1,26 @@
+import os
+import asyncio
+import time
+import re
+import hashlib
 import fastapi
 import uvicorn
+import msgspec
+import orjson
 import pandas as pd
 import numpy as np
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel, Field
-from typing import List
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel
+from typing import Annotated, List
+
+try:
+    import numba
+except ImportError:  # Numba is optional; fall back to the NumPy path
+    numba = None
 
 # --- Configuration & Strategy Rules ---
 RANGE_CONFIG = {
@@ -26,220 +42,445 @@ IMPULSE_CONFIG = {
 TREND_THRESHOLD_PCT = 0.1
 TREND_LOOKBACK = 10
 
-# --- Pydantic Models ---
-class CandleDataInput(BaseModel):
+RESULT_CACHE_CONFIG = {
+    "max_entries": 1024,
+    "ttl_seconds": 60.0,
+}
+
+# Share of the range width on each side that counts as "near" an extreme
+_MID_COEF = (100 - RANGE_CONFIG["midrange_pct"]) / 200
+
+# --- Request Models (decoded with msgspec) ---
+# Prices must be positive, which also rules out NaN and keeps range midpoints above zero
+Price = Annotated[float, msgspec.Meta(gt=0)]
+
+class CandleDataInput(msgspec.Struct):
     timestamp: str
-    open: float
-    high: float
-    low: float
-    close: float
+    open: Price
+    high: Price
+    low: Price
+    close: Price
+
+class AnalysisRequest(msgspec.Struct):
+    ohlc_data: Annotated[
+        List[CandleDataInput], msgspec.Meta(min_length=RANGE_CONFIG["min_candles"])
+    ]
+
+# Lax mode keeps accepting numeric strings such as "401.5", as Pydantic did
+_request_decoder = msgspec.json.Decoder(AnalysisRequest, strict=False)
+
+# Request schema for the OpenAPI docs, since the endpoint reads the raw body
+(_request_schema,), _request_components = msgspec.json.schema_components(
+    [AnalysisRequest], ref_template="#/components/schemas/{name}"
+)
+
+_ERROR_PATH = re.compile(r"^(.*) - at `\$(.*)`$")
+_PATH_PART = re.compile(r"\.(\w+)|\[(\d+)\]")
+
+def _request_errors(error: msgspec.DecodeError) -> list[dict]:
+    """Converts a msgspec decode error into FastAPI's validation error list"""
+    if not isinstance(error, msgspec.ValidationError):
+        return [{"type": "json_invalid", "loc": ["body"], "msg": str(error)}]
 
-class AnalysisRequest(BaseModel):
-    ohlc_data: List[CandleDataInput] = Field(..., min_items=RANGE_CONFIG["min_candles"])
+    loc = ["body"]
+    msg = str(error)
+    match = _ERROR_PATH.match(msg)
+    if match:
+        msg = match.group(1)
+        for key, index in _PATH_PART.findall(match.group(2)):
+            loc.append(key or int(index))
+    return [{"type": "value_error", "loc": loc, "msg": msg}]
 
+# --- Pydantic Models ---
 class AnalysisResult(BaseModel):
     strategy_suggestion: str
     reason: str | None = None
 
+# --- Candle Arrays ---
+@dataclass
+class Candles:
+    """Column-wise OHLC arrays in chronological order"""
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    body_ratio: np.ndarray
+
+    def __len__(self) -> int:
+        return self.close.shape[0]
+
 # --- Helper Functions ---
-def preprocess_data_from_json(data: List[CandleDataInput]) -> pd.DataFrame:
+def _jit(func, **options):
+    """Compiles func with Numba when it is installed, otherwise returns it unchanged"""
+    if numba is None:
+        return func
+    return numba.njit(cache=True, nogil=True, **options)(func)
+
+def preprocess_data_from_json(data: List[CandleDataInput]) -> Candles:
     try:
-        data_dicts = [candle.dict() for candle in data]
-        df = pd.DataFrame(data_dicts)
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-        df = df.set_index('timestamp').sort_index()
-        
+        n = len(data)
+        timestamps = [None] * n
+        open_ = np.empty(n, dtype=np.float64)
+        high = np.empty(n, dtype=np.float64)
+        low = np.empty(n, dtype=np.float64)
+        close = np.empty(n, dtype=np.float64)
+        # Single pass over the models, no per-candle dict
+        for i, candle in enumerate(data):
+            timestamps[i] = candle.timestamp
+            open_[i] = candle.open
+            high[i] = candle.high
+            low[i] = candle.low
+            close[i] = candle.close
+
+        # Timestamps only decide the candle order; most feeds are already sorted
+        timestamps = pd.to_datetime(timestamps)
+        if not timestamps.is_monotonic_increasing:
+            order = np.argsort(timestamps, kind='stable')
+            open_, high, low, close = open_[order], high[order], low[order], close[order]
+
         # Calculate candle metrics
-        df['body'] = abs(df['close'] - df['open'])
-        df['range'] = df['high'] - df['low']
-        df['body_ratio'] = np.where(
-            df['range'] == 0, 0,
-            (df['body'] / df['range']) * 100
-        )
-        return df
+        body = np.abs(close - open_)
+        rng = high - low
+        with np.errstate(divide='ignore', invalid='ignore'):
+            body_ratio = np.where(rng == 0, 0.0, (body / rng) * 100)
+        return Candles(open_, high, low, close, body_ratio)
     except Exception as e:
         raise ValueError(f"Data processing error: {e}")
 
-def check_price_near_extreme(price, range_low, range_high, midrange_pct):
-    total_range = range_high - range_low
-    if total_range <= 0:
-        return False
-        
-    lower_bound = range_low + total_range * ((100 - midrange_pct)/2/100)
-    upper_bound = range_high - total_range * ((100 - midrange_pct)/2/100)
-    return price < lower_bound or price > upper_bound
+def check_price_near_extreme(price, range_low, range_high):
+    """Works on scalars or NumPy arrays of prices (returns a boolean mask)"""
+    span = range_high - range_low
+    inset = span * _MID_COEF
+    return (span > 0) & ((price < range_low + inset) | (price > range_high - inset))
+
+check_price_near_extreme = _jit(check_price_near_extreme)
 
 # --- Core Analysis Functions ---
-def detect_range(df: pd.DataFrame) -> dict | None:
-    """Identifies valid price ranges using rolling window approach"""
-    min_candles = RANGE_CONFIG["min_candles"]
-    if len(df) < min_candles:
-        return None
+# Kernels return integer codes; these map them back to labels
+_STRATEGY_NAMES = ("No Entry", "Limit Catch Entry", "In-Price Entry")
+_TREND_NAMES = {0: None, 1: "uptrend", -1: "downtrend"}
 
-    # Check windows starting from most recent data
-    for start_idx in range(len(df) - min_candles, -1, -1):
-        window = df.iloc[start_idx:start_idx + min_candles]
-        window_high = window['high'].max()
-        window_low = window['low'].min()
+def _rolling_extrema(high, low, window):
+    """Sliding-window max of high and min of low using monotonic deques, O(N) overall"""
+    n = high.shape[0]
+    win_high = np.empty(n - window + 1, dtype=np.float64)
+    win_low = np.empty(n - window + 1, dtype=np.float64)
+    # Array-backed deques of candle indices so Numba can compile them
+    max_q = np.empty(n, dtype=np.int64)
+    min_q = np.empty(n, dtype=np.int64)
+    max_head = max_tail = 0
+    min_head = min_tail = 0
+    for i in range(n):
+        while max_tail > max_head and high[max_q[max_tail - 1]] <= high[i]:
+            max_tail -= 1
+        max_q[max_tail] = i
+        max_tail += 1
+        if max_q[max_head] <= i - window:
+            max_head += 1
 
-        if pd.isna(window_high) or window_high <= window_low:
-            continue
+        while min_tail > min_head and low[min_q[min_tail - 1]] >= low[i]:
+            min_tail -= 1
+        min_q[min_tail] = i
+        min_tail += 1
+        if min_q[min_head] <= i - window:
+            min_head += 1
 
-        # Calculate touch tolerance
-        high_tol = window_high * (RANGE_CONFIG["touch_tolerance_pct"] / 100)
-        low_tol = window_low * (RANGE_CONFIG["touch_tolerance_pct"] / 100)
+        if i >= window - 1:
+            win_high[i - window + 1] = high[max_q[max_head]]
+            win_low[i - window + 1] = low[min_q[min_head]]
+    return win_high, win_low
 
-        # Count valid touches
-        high_touches = window[window['high'] >= window_high - high_tol]
-        low_touches = window[window['low'] <= window_low + low_tol]
+_rolling_extrema = _jit(_rolling_extrema)
+
+def _make_range_kernel(min_candles, min_touches, width_min_pct, width_max_pct,
+                       touch_tolerance_pct, **_unused):
+    """Builds the range kernel with the range rules baked in as closure constants"""
+    tol = touch_tolerance_pct / 100
+
+    def kernel(high, low, close):
+        """Scans windows from most recent back, returning start index -1 if none is valid"""
+        if high.shape[0] < min_candles:
+            return -1, 0.0, 0.0, 0.0
+        win_high, win_low = _rolling_extrema(high, low, min_candles)
+        for start_idx in range(high.shape[0] - min_candles, -1, -1):
+            end = start_idx + min_candles
+            window_high = win_high[start_idx]
+            window_low = win_low[start_idx]
+
+            if not window_high > window_low:
+                continue
+
+            # Count valid touches
+            high_level = window_high - window_high * tol
+            low_level = window_low + window_low * tol
+            high_touches = 0
+            low_touches = 0
+            for i in range(start_idx, end):
+                if high[i] >= high_level:
+                    high_touches += 1
+                if low[i] <= low_level:
+                    low_touches += 1
+            if high_touches < min_touches or low_touches < min_touches:
+                continue
 
-        if (len(high_touches) >= RANGE_CONFIG["min_touches"] and 
-            len(low_touches) >= RANGE_CONFIG["min_touches"]):
-            
-            width = window_high - window_low
             midpoint = (window_high + window_low) / 2
-            if midpoint == 0:
+            width_pct = ((window_high - window_low) / midpoint) * 100
+            if width_pct < width_min_pct or width_pct > width_max_pct:
                 continue
-                
-            width_pct = (width / midpoint) * 100
-            if RANGE_CONFIG["width_min_pct"] <= width_pct <= RANGE_CONFIG["width_max_pct"]:
-                # Verify last close position
-                last_close = window['close'].iloc[-1]
-                upper_bound = window_high * (1 + RANGE_CONFIG["touch_tolerance_pct"]/100)
-                lower_bound = window_low * (1 - RANGE_CONFIG["touch_tolerance_pct"]/100)
-                
-                if lower_bound <= last_close <= upper_bound:
-                    return {
-                        "high": window_high,
-                        "low": window_low,
-                        "width_pct": width_pct,
-                        "start_index": start_idx,
-                        "end_index": start_idx + min_candles - 1
-                    }
-    return None
-
-def detect_trend_and_bos(df: pd.DataFrame) -> tuple[str | None, bool]:
-    """Improved trend detection with dynamic lookback"""
-    if len(df) < TREND_LOOKBACK + 1:
-        return None, False
-
-    lookback_data = df.iloc[-TREND_LOOKBACK-1:-1]  # Exclude last candle
-    recent_data = df.iloc[-TREND_LOOKBACK:]
-    
+
+            # Verify the window's own closing candle sits inside the range
+            window_close = close[end - 1]
+            if window_low * (1 - tol) <= window_close <= window_high * (1 + tol):
+                return start_idx, window_high, window_low, width_pct
+        return -1, 0.0, 0.0, 0.0
+
+    def kernel_numpy(high, low, close):
+        """Vectorized fallback for the kernel when Numba is not installed"""
+        if high.shape[0] < min_candles:
+            return -1, 0.0, 0.0, 0.0
+        # One view per column: row i is the window starting at candle i
+        sw_high = np.lib.stride_tricks.sliding_window_view(high, min_candles)
+        sw_low = np.lib.stride_tricks.sliding_window_view(low, min_candles)
+        window_close = close[min_candles - 1:]  # Closing candle of each window
+        win_high = sw_high.max(axis=1)
+        win_low = sw_low.min(axis=1)
+
+        # Count valid touches
+        high_touches = (sw_high >= (win_high - win_high * tol)[:, None]).sum(axis=1)
+        low_touches = (sw_low <= (win_low + win_low * tol)[:, None]).sum(axis=1)
+
+        width = win_high - win_low
+        midpoint = (win_high + win_low) / 2
+        width_pct = (width / midpoint) * 100
+
+        valid = (
+            (win_high > win_low)
+            & (high_touches >= min_touches)
+            & (low_touches >= min_touches)
+            & (width_pct >= width_min_pct)
+            & (width_pct <= width_max_pct)
+            # Verify the window's own closing candle sits inside the range
+            & (window_close >= win_low * (1 - tol))
+            & (window_close <= win_high * (1 + tol))
+        )
+        candidates = np.flatnonzero(valid)
+        if candidates.size == 0:
+            return -1, 0.0, 0.0, 0.0
+
+        # Most recent valid window wins
+        start_idx = int(candidates[-1])
+        return start_idx, win_high[start_idx], win_low[start_idx], width_pct[start_idx]
+
+    if numba is None:
+        return kernel_numpy
+    return _jit(kernel, fastmath=True)
+
+def _make_impulse_kernel(min_candles_consecutive, max_candles_total,
+                         min_total_pct_change, min_body_pct):
+    """Builds the impulse kernel with the impulse rules baked in as closure constants"""
+
+    def kernel(open_, close, body_ratio, n):
+        """Impulse check over the first n candles, so prefixes need no slicing"""
+        for num_candles in range(min_candles_consecutive, max_candles_total + 1):
+            if n < num_candles:
+                continue
+
+            first = n - num_candles
+            start_price = open_[first]
+            end_price = close[n - 1]
+
+            if start_price == 0:
+                continue
+
+            pct_change = abs((end_price - start_price) / start_price) * 100
+            if pct_change < min_total_pct_change:
+                continue
+
+            # Check body ratios and direction consistency
+            body_total = 0.0
+            for i in range(first, n):
+                body_total += body_ratio[i]
+            if body_total / num_candles < min_body_pct:
+                continue
+
+            direction = np.sign(end_price - start_price)
+            consistent = True
+            for i in range(first, n):
+                if not (close[i] - open_[i]) * direction >= 0:
+                    consistent = False
+                    break
+
+            if consistent:
+                return True
+
+        return False
+
+    return _jit(kernel)
+
+def _trend_kernel(high, low, close):
+    """Returns (trend, bos) with trend 1 for uptrend, -1 for downtrend, 0 for none"""
+    n = close.shape[0]
+    if n < TREND_LOOKBACK + 1:
+        return 0, False
+
+    lookback_start = n - TREND_LOOKBACK - 1  # Lookback excludes last candle
+
     # Trend detection
-    price_change = (recent_data['close'].iloc[-1] - lookback_data['close'].iloc[0]) 
-    price_change_pct = (price_change / lookback_data['close'].iloc[0]) * 100
-    
-    trend = None
-    if price_change_pct > TREND_THRESHOLD_PCT:
-        trend = "uptrend"
-    elif price_change_pct < -TREND_THRESHOLD_PCT:
-        trend = "downtrend"
+    start = close[lookback_start]
+    if start == 0:
+        return 0, False
+    price_change_pct = ((close[n - 1] - start) / start) * 100
 
     # BoS detection
-    bos = False
-    if trend == "uptrend":
-        prev_high = lookback_data['high'].max()
-        bos = df['high'].iloc[-1] > prev_high
-    elif trend == "downtrend":
-        prev_low = lookback_data['low'].min()
-        bos = df['low'].iloc[-1] < prev_low
-
-    return trend, bos
-
-def check_recent_impulse(df: pd.DataFrame) -> bool:
-    """Enhanced impulse detection with directional consistency"""
-    for num_candles in range(IMPULSE_CONFIG["min_candles_consecutive"], 
-                           IMPULSE_CONFIG["max_candles_total"] + 1):
-        if len(df) < num_candles:
-            continue
-            
-        subset = df.iloc[-num_candles:]
-        start_price = subset['open'].iloc[0]
-        end_price = subset['close'].iloc[-1]
-        
-        if start_price == 0:
-            continue
-            
-        pct_change = abs((end_price - start_price) / start_price) * 100
-        if pct_change < IMPULSE_CONFIG["min_total_pct_change"]:
-            continue
-            
-        # Check body ratios and direction consistency
-        body_ratios = subset['body_ratio']
-        if body_ratios.mean() < IMPULSE_CONFIG["min_body_pct"]:
-            continue
-            
-        direction = np.sign(end_price - start_price)
-        consistent = all(
-            (candle['close'] - candle['open']) * direction >= 0
-            for _, candle in subset.iterrows()
-        )
-        
-        if consistent:
-            return True
-            
-    return False
+    if price_change_pct > TREND_THRESHOLD_PCT:
+        return 1, high[n - 1] > high[lookback_start:n - 1].max()
+    if price_change_pct < -TREND_THRESHOLD_PCT:
+        return -1, low[n - 1] < low[lookback_start:n - 1].min()
+    return 0, False
+
+_range_kernel = _make_range_kernel(**RANGE_CONFIG)
+_impulse_kernel = _make_impulse_kernel(**IMPULSE_CONFIG)
+_trend_kernel = _jit(_trend_kernel)
 
 # --- Main Analysis Logic ---
-def analyze_data(df: pd.DataFrame) -> tuple[str, str]:
+def analyze_arrays(open_, high, low, close, body_ratio):
+    """Runs the range, trend and impulse kernels in turn within one compiled call.
+
+    Each kernel still makes its own pass over the arrays; only the range
+    scan covers the full history, the others read the last few candles.
+
+    Returns (strategy, range start or -1, range high, range low, range
+    width %, trend, BoS, current impulse); strategy indexes _STRATEGY_NAMES
+    and trend keys _TREND_NAMES.
+    """
+    start_idx, range_high, range_low, width_pct = _range_kernel(high, low, close)
+
+    # 1. Check Limit Catch conditions, with no impulse before the range
+    if start_idx >= 0:
+        if (check_price_near_extreme(close[close.shape[0] - 1], range_low, range_high)
+                and not _impulse_kernel(open_, close, body_ratio, start_idx)):
+            return 1, start_idx, range_high, range_low, width_pct, 0, False, False
+
+    # 2. Check In-Price Entry conditions
+    trend, bos = _trend_kernel(high, low, close)
+    impulse = _impulse_kernel(open_, close, body_ratio, close.shape[0])
+    strategy = 2 if trend != 0 and bos and not impulse else 0
+    return strategy, start_idx, range_high, range_low, width_pct, trend, bos, impulse
+
+analyze_arrays = _jit(analyze_arrays)
+
+def analyze_data(candles: Candles) -> tuple[str, str]:
     """Enhanced analysis with clear priority logic"""
-    detected_range = detect_range(df)
-    last_close = df['close'].iloc[-1]
+    (strategy, start_idx, range_high, range_low, width_pct,
+     trend, bos, impulse) = analyze_arrays(
+        candles.open, candles.high, candles.low, candles.close, candles.body_ratio
+    )
     reason = []
 
-    # 1. Check Limit Catch conditions
-    if detected_range:
-        range_low = detected_range['low']
-        range_high = detected_range['high']
-        
-        in_entry_zone = check_price_near_extreme(
-            last_close, range_low, range_high, 
-            RANGE_CONFIG["midrange_pct"]
-        )
-        
-        range_details = (
+    if start_idx >= 0:
+        reason.append(
             f"Range detected ({range_low:.2f}-{range_high:.2f}, "
-            f"Width: {detected_range['width_pct']:.2f}%)"
+            f"Width: {width_pct:.2f}%)"
         )
-        reason.append(range_details)
-        
-        if in_entry_zone:
-            # Check for pre-range impulse
-            pre_range_data = df.iloc[:detected_range['start_index']]
-            if not check_recent_impulse(pre_range_data):
-                reason.append("Price in entry zone with no prior impulse")
-                return "Limit Catch Entry", ". ".join(reason)
+        if strategy == 1:
+            reason.append("Price in entry zone with no prior impulse")
+            return _STRATEGY_NAMES[strategy], ". ".join(reason)
 
-    # 2. Check In-Price Entry conditions
-    trend, bos = detect_trend_and_bos(df)
-    current_impulse = check_recent_impulse(df)
-    
-    reason.append(f"Trend: {trend or 'none'}, BoS: {bos}, Impulse: {current_impulse}")
-    
-    if trend and bos and not current_impulse:
+    reason.append(
+        f"Trend: {_TREND_NAMES[trend] or 'none'}, BoS: {bool(bos)}, "
+        f"Impulse: {bool(impulse)}"
+    )
+
+    if strategy == 2:
         reason.append("Trend with BoS and no current impulse")
-        return "In-Price Entry", ". ".join(reason)
+        return _STRATEGY_NAMES[strategy], ". ".join(reason)
 
     # 3. Default case
-    return "No Entry", ". ".join(reason) or "No patterns detected"
+    return _STRATEGY_NAMES[strategy], ". ".join(reason) or "No patterns detected"
+
+def _run_analysis(data: List[CandleDataInput]) -> tuple[str, str]:
+    """Preprocesses and analyzes a request's candles in one worker-thread call"""
+    return analyze_data(preprocess_data_from_json(data))
 
 # --- FastAPI Endpoint ---
-app = FastAPI(title="Price Action Strategy Analyzer")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Compile (or load from the on-disk cache) the Numba kernels before serving
+    if numba is not None:
+        analyze_data(Candles(*(np.zeros(20) for _ in range(5))))
+    yield
 
-@app.post("/analyze", response_model=AnalysisResult)
-async def analyze_ohlc(request: AnalysisRequest):
-    try:
-        df = preprocess_data_from_json(request.ohlc_data)
-        strategy, reason = analyze_data(df)
-        return AnalysisResult(
-            strategy_suggestion=strategy,
-            reason=reason
+app = FastAPI(title="Price Action Strategy Analyzer", lifespan=lifespan)
+
+def _openapi() -> dict:
+    # Add the msgspec request models next to FastAPI's own schemas
+    if app.openapi_schema is None:
+        schema = FastAPI.openapi(app)
+        schema.setdefault("components", {}).setdefault("schemas", {}).update(
+            _request_components
         )
+    return app.openapi_schema
+
+app.openapi = _openapi
+
+# Encoded analysis results keyed by payload digest, oldest first: digest -> (stored_at, body)
+_result_cache: "OrderedDict[bytes, tuple[float, bytes]]" = OrderedDict()
+
+def _cached_result(key: bytes) -> bytes | None:
+    entry = _result_cache.get(key)
+    if entry is None:
+        return None
+    if time.monotonic() - entry[0] > RESULT_CACHE_CONFIG["ttl_seconds"]:
+        del _result_cache[key]
+        return None
+    _result_cache.move_to_end(key)
+    return entry[1]
+
+def _store_result(key: bytes, result: bytes) -> None:
+    _result_cache[key] = (time.monotonic(), result)
+    _result_cache.move_to_end(key)
+    if len(_result_cache) > RESULT_CACHE_CONFIG["max_entries"]:
+        _result_cache.popitem(last=False)
+
+@app.post(
+    "/analyze",
+    response_model=AnalysisResult,
+    openapi_extra={"requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": _request_schema}},
+    }},
+)
+async def analyze_ohlc(request: Request):
+    body = await request.body()
+    # Dashboards re-poll identical OHLC slices; serve repeats without re-analysis
+    key = hashlib.blake2b(body, digest_size=16).digest()
+    cached = _cached_result(key)
+    if cached is not None:
+        return Response(cached, media_type="application/json")
+
+    try:
+        payload = _request_decoder.decode(body)
+    except msgspec.DecodeError as de:
+        raise RequestValidationError(_request_errors(de))
+
+    try:
+        # Parsing and analysis both run off the event loop
+        strategy, reason = await asyncio.to_thread(_run_analysis, payload.ohlc_data)
+        # Encode with orjson; response_model only documents the schema
+        result = orjson.dumps({
+            "strategy_suggestion": strategy,
+            "reason": reason
+        })
+        _store_result(key, result)
+        return Response(result, media_type="application/json")
     except ValueError as ve:
         raise HTTPException(400, detail=str(ve))
     except Exception as e:
         raise HTTPException(500, detail=f"Analysis error: {str(e)}")
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # Analysis is CPU-bound, so scale out with one worker process per core
+    uvicorn.run(
+        "startegy:app", host="0.0.0.0", port=8000,
+        loop="uvloop", http="httptools", workers=os.cpu_count()
+    )
\ No newline at end of file